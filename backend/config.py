@@ -1,6 +1,10 @@
 """Configuration for the LLM Council."""
 
 import os
+import re
+import sys
+from types import MappingProxyType
+from typing import Any, Mapping, Tuple
 from dotenv import load_dotenv
 
 load_dotenv()
@@ -9,16 +13,18 @@ load_dotenv()
 OPENROUTER_API_KEY = os.getenv("OPENROUTER_API_KEY")
 
 # Council members - list of OpenRouter model identifiers
+# Model ids and prefixes are interned so lookups against the (also interned)
+# OpenRouter model list can compare by identity
 COUNCIL_MODELS = [
-    "openai/gpt-5.1",
-    "google/gemini-3-pro-preview",
-    "anthropic/claude-opus-4.5",
-    "x-ai/grok-4",
-    "deepseek/deepseek-v3.2-speciale",
+    sys.intern("openai/gpt-5.1"),
+    sys.intern("google/gemini-3-pro-preview"),
+    sys.intern("anthropic/claude-opus-4.5"),
+    sys.intern("x-ai/grok-4"),
+    sys.intern("deepseek/deepseek-v3.2-speciale"),
 ]
 
 # Chairman model - synthesizes final response
-CHAIRMAN_MODEL = "google/gemini-3-pro-preview"
+CHAIRMAN_MODEL = sys.intern("google/gemini-3-pro-preview")
 
 # OpenRouter API endpoint
 OPENROUTER_API_URL = "https://openrouter.ai/api/v1/chat/completions"
@@ -27,6 +33,9 @@ OPENROUTER_API_URL = "https://openrouter.ai/api/v1/chat/completions"
 # Data directory for conversation storage
 DATA_DIR = "data/conversations"
 
+# On-disk cache of the OpenRouter model list (shared across worker processes)
+MODEL_CACHE_PATH = "data/model_cache.json"
+
 # Reasoning configuration
 # Controls whether to request reasoning for Stage 1 (Collection)
 REASONING_IN_STAGE1 = True
@@ -54,16 +63,102 @@ PROVIDER_REASONING_DEFAULTS = {
     # DeepSeek: Uses discrete exclude toggles or implicit CoT
     "deepseek": {"exclude": False},
     # Mistral: Anticipating effort support
+    # (plain prefix, so it also matches OpenRouter's 'mistralai/...' slugs)
     "mistral": {"effort": "medium"},
 }
 
+# Effort level sets (shared tuples, returned as-is by model capability lookups)
+_EFFORT_LMH = ("low", "medium", "high")
+_EFFORT_LH = ("low", "high")
+
+# Default for effort-based providers not listed in PROVIDER_EFFORT_LEVELS
+DEFAULT_EFFORT_LEVELS = _EFFORT_LH
+
 # Effort levels supported per provider prefix
 # Uses longest-prefix matching like PROVIDER_REASONING_DEFAULTS
 PROVIDER_EFFORT_LEVELS = {
     # Full support: low, medium, high
-    "openai": ["low", "medium", "high"],
-    "x-ai": ["low", "medium", "high"],
-    "mistral": ["low", "medium", "high"],
+    "openai": _EFFORT_LMH,
+    "x-ai": _EFFORT_LMH,
+    "mistral": _EFFORT_LMH,
     # Gemini 3+ only supports low and high (no medium)
-    "google": ["low", "high"],
+    "google": _EFFORT_LH,
+}
+
+# Intern prefix keys (shared by the derived lookup tables below) and freeze the
+# reasoning configs so they can be handed out without defensive copies
+PROVIDER_REASONING_DEFAULTS = {
+    sys.intern(prefix): MappingProxyType(config)
+    for prefix, config in PROVIDER_REASONING_DEFAULTS.items()
 }
+PROVIDER_EFFORT_LEVELS = {
+    sys.intern(prefix): levels for prefix, levels in PROVIDER_EFFORT_LEVELS.items()
+}
+
+# Reasoning token budget limits (min, max) for token-based providers
+PROVIDER_TOKEN_LIMITS = {
+    # Anthropic Claude: 1024-64000 range
+    "anthropic": (1024, 64000),
+    # Google thinking models: similar range
+    "google": (1024, 32000),
+}
+
+# Generic fallback for token-based providers not listed above
+DEFAULT_TOKEN_LIMITS = (1024, 16000)
+
+# Plain string prefixes like the other tables, longest first
+_SORTED_TOKEN_LIMIT_PREFIXES = tuple(
+    sorted(PROVIDER_TOKEN_LIMITS.keys(), key=len, reverse=True)
+)
+
+
+def _token_range(prefix: str, config: Mapping[str, Any]) -> Mapping[str, int]:
+    """Build the read-only {"min", "max", "default"} token range for a prefix."""
+    min_tokens, max_tokens = next(
+        (
+            PROVIDER_TOKEN_LIMITS[key]
+            for key in _SORTED_TOKEN_LIMIT_PREFIXES
+            if prefix.startswith(key)
+        ),
+        DEFAULT_TOKEN_LIMITS,
+    )
+    return MappingProxyType(
+        {
+            "min": min_tokens,
+            "max": max_tokens,
+            "default": config.get("max_tokens", 4096),
+        }
+    )
+
+
+# Token ranges keyed by reasoning prefix, precomputed for token-based configs
+PROVIDER_TOKEN_RANGE = {
+    prefix: _token_range(prefix, config)
+    for prefix, config in PROVIDER_REASONING_DEFAULTS.items()
+    if "max_tokens" in config
+}
+
+# Prefixes sorted by length (descending) so the most specific prefix is tried first,
+# e.g. 'google/gemini-2.0-flash-thinking' matches before 'google'
+SORTED_REASONING_PREFIXES = tuple(
+    sorted(PROVIDER_REASONING_DEFAULTS.keys(), key=len, reverse=True)
+)
+SORTED_EFFORT_PREFIXES = tuple(
+    sorted(PROVIDER_EFFORT_LEVELS.keys(), key=len, reverse=True)
+)
+
+
+def _compile_prefix_pattern(prefixes: Tuple[str, ...]) -> "re.Pattern[str]":
+    """
+    Compile an anchored alternation of prefixes, capturing the matched prefix.
+
+    Alternatives are tried in order, so prefixes must be sorted longest first.
+    Matching is plain string-prefix matching (like str.startswith), so
+    'mistral' also covers OpenRouter's 'mistralai/...' slugs.
+    """
+    return re.compile("^(" + "|".join(re.escape(prefix) for prefix in prefixes) + ")")
+
+
+# Single-pass longest-prefix matchers (the regex engine does the scan in C)
+REASONING_PREFIX_RE = _compile_prefix_pattern(SORTED_REASONING_PREFIXES)
+EFFORT_PREFIX_RE = _compile_prefix_pattern(SORTED_EFFORT_PREFIXES)
@@ -1,8 +1,8 @@
 """3-stage LLM Council orchestration."""
 
 from dataclasses import dataclass, field
-from typing import List, Dict, Any, Tuple
-from .openrouter import query_models_parallel, query_model
+from typing import List, Dict, Any, AsyncIterator, Tuple
+from .openrouter import query_models_parallel, query_models_parallel_stream, query_model
 from .config import (
     COUNCIL_MODELS,
     CHAIRMAN_MODEL,
@@ -56,39 +56,81 @@ class CouncilConfig:
         }
 
 
-async def stage1_collect_responses(
+def order_by_council(
+    results: List[Dict[str, Any]], council_models: List[str]
+) -> List[Dict[str, Any]]:
+    """
+    Sort per-model results back into council order.
+
+    Parallel queries complete in arbitrary order; keeping the configured order
+    makes tabs and anonymized labels stable across runs.
+    """
+    position = {model: i for i, model in enumerate(dict.fromkeys(council_models))}
+    return sorted(results, key=lambda result: position[result["model"]])
+
+
+async def stage1_stream_responses(
     user_query: str,
     config: "CouncilConfig" = None,
-) -> List[Dict[str, Any]]:
+) -> AsyncIterator[Dict[str, Any]]:
     """
-    Stage 1: Collect individual responses from all council models.
+    Stage 1: Stream individual responses from council models as they generate.
 
     Args:
         user_query: The user's question
         config: Council configuration (uses defaults if None)
 
-    Returns:
-        List of dicts with 'model' and 'response' keys
+    Yields:
+        Event dicts, interleaved across models:
+        - {"type": "delta", "model": str, "content": str} for each token chunk
+        - {"type": "complete", "model": str, "response": str} when a model finishes
+        - {"type": "failed", "model": str} if a model fails (drop its partial text)
     """
     if config is None:
         config = CouncilConfig.from_defaults()
 
     messages = [{"role": "user", "content": user_query}]
 
-    # Query all models in parallel
-    responses = await query_models_parallel(
+    # Stream all models in parallel, forwarding tokens as they arrive
+    async for model, event in query_models_parallel_stream(
         config.council_models, messages, include_reasoning=config.reasoning_stage1
-    )
+    ):
+        if event["type"] == "delta":
+            yield {"type": "delta", "model": model, "content": event["content"]}
+        elif event["response"] is not None:  # Only include successful responses
+            yield {
+                "type": "complete",
+                "model": model,
+                "response": event["response"].get("content", ""),
+            }
+        else:
+            yield {"type": "failed", "model": model}
 
-    # Format results
-    stage1_results = []
-    for model, response in responses.items():
-        if response is not None:  # Only include successful responses
-            stage1_results.append(
-                {"model": model, "response": response.get("content", "")}
-            )
 
-    return stage1_results
+async def stage1_collect_responses(
+    user_query: str,
+    config: "CouncilConfig" = None,
+) -> List[Dict[str, Any]]:
+    """
+    Stage 1: Collect individual responses from all council models.
+
+    Args:
+        user_query: The user's question
+        config: Council configuration (uses defaults if None)
+
+    Returns:
+        List of dicts with 'model' and 'response' keys, in council order
+    """
+    if config is None:
+        config = CouncilConfig.from_defaults()
+
+    stage1_results = [
+        {"model": event["model"], "response": event["response"]}
+        async for event in stage1_stream_responses(user_query, config)
+        if event["type"] == "complete"
+    ]
+
+    return order_by_council(stage1_results, config.council_models)
 
 
 async def stage2_collect_rankings(
@@ -159,14 +201,11 @@ Now provide your evaluation and ranking:"""
 
     messages = [{"role": "user", "content": ranking_prompt}]
 
-    # Get rankings from all council models in parallel
-    responses = await query_models_parallel(
-        config.council_models, messages, include_reasoning=config.reasoning_stage2
-    )
-
-    # Format results
+    # Get rankings from all council models in parallel, parsing each as it arrives
     stage2_results = []
-    for model, response in responses.items():
+    async for model, response in query_models_parallel(
+        config.council_models, messages, include_reasoning=config.reasoning_stage2
+    ):
         if response is not None:
             full_text = response.get("content", "")
             parsed = parse_ranking_from_text(full_text)
@@ -174,7 +213,7 @@ Now provide your evaluation and ranking:"""
                 {"model": model, "ranking": full_text, "parsed_ranking": parsed}
             )
 
-    return stage2_results, label_to_model
+    return order_by_council(stage2_results, config.council_models), label_to_model
 
 
 async def stage3_synthesize_final(
@@ -11,11 +11,13 @@ import asyncio
 
 from . import storage
 from . import models
+from . import openrouter
 from .council import (
     CouncilConfig,
     run_full_council,
     generate_conversation_title,
-    stage1_collect_responses,
+    stage1_stream_responses,
+    order_by_council,
     stage2_collect_rankings,
     stage3_synthesize_final,
     calculate_aggregate_rankings,
@@ -33,6 +35,25 @@ app.add_middleware(
 )
 
 
+# Background cache warmup started on startup (kept to avoid garbage collection)
+_warmup_task: Optional[asyncio.Task] = None
+
+
+@app.on_event("startup")
+async def startup():
+    """Warm model caches in the background so the first request is fast."""
+    global _warmup_task
+    _warmup_task = asyncio.create_task(models.warmup())
+
+
+@app.on_event("shutdown")
+async def shutdown():
+    """Stop a pending warmup and release pooled OpenRouter connections."""
+    if _warmup_task is not None and not _warmup_task.done():
+        _warmup_task.cancel()
+    await openrouter.close_client()
+
+
 class CreateConversationRequest(BaseModel):
     """Request to create a new conversation."""
 
@@ -94,7 +115,7 @@ async def create_conversation(request: CreateConversationRequest):
 async def validate_model(request: ValidateModelRequest):
     """Validate a model endpoint exists and return its capabilities."""
     result = await models.validate_model(request.model_id)
-    return result
+    return result.to_dict()
 
 
 @app.get("/api/conversations/{conversation_id}", response_model=Conversation)
@@ -188,13 +209,24 @@ async def send_message_stream(conversation_id: str, request: SendMessageRequest)
                 )
 
             # Build config from conversation (or use defaults)
-            config = None
             if conversation.get("config"):
                 config = CouncilConfig.from_dict(conversation["config"])
+            else:
+                config = CouncilConfig.from_defaults()
 
-            # Stage 1: Collect responses
+            # Stage 1: Stream responses, forwarding tokens as each model generates
             yield f"data: {json.dumps({'type': 'stage1_start'})}\n\n"
-            stage1_results = await stage1_collect_responses(request.content, config)
+            stage1_results = []
+            async for event in stage1_stream_responses(request.content, config):
+                if event["type"] == "delta":
+                    yield f"data: {json.dumps({'type': 'stage1_delta', 'data': {'model': event['model'], 'content': event['content']}})}\n\n"
+                elif event["type"] == "complete":
+                    result = {"model": event["model"], "response": event["response"]}
+                    stage1_results.append(result)
+                    yield f"data: {json.dumps({'type': 'stage1_model_complete', 'data': result})}\n\n"
+                else:
+                    yield f"data: {json.dumps({'type': 'stage1_model_failed', 'data': {'model': event['model']}})}\n\n"
+            stage1_results = order_by_council(stage1_results, config.council_models)
             yield f"data: {json.dumps({'type': 'stage1_complete', 'data': stage1_results})}\n\n"
 
             # Stage 2: Collect rankings
@@ -1,71 +1,90 @@
 """Model validation and reasoning capability detection."""
 
-import httpx
+import asyncio
+import fcntl
+import orjson
+import os
+import sys
 import time
-from typing import Dict, Any, Optional, List, Set
+from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, Any, FrozenSet, Iterable, Optional, Mapping, Tuple
 from .config import (
+    COUNCIL_MODELS,
+    CHAIRMAN_MODEL,
     PROVIDER_REASONING_DEFAULTS,
     PROVIDER_EFFORT_LEVELS,
+    DEFAULT_EFFORT_LEVELS,
+    PROVIDER_TOKEN_RANGE,
+    REASONING_PREFIX_RE,
+    EFFORT_PREFIX_RE,
+    MODEL_CACHE_PATH,
 )
 
+# Shared empty result for models without effort-based reasoning
+_NO_EFFORT_LEVELS: Tuple[str, ...] = ()
 
-def get_reasoning_config(model_id: str) -> Optional[Dict[str, Any]]:
+
+@lru_cache(maxsize=256)
+def get_reasoning_config(model_id: str) -> Optional[Mapping[str, Any]]:
     """
     Get default reasoning config based on provider prefix.
 
     Uses longest-prefix matching to find the most specific config.
+    The returned mapping is the shared, read-only provider default; callers
+    that need to mutate it should take a copy with dict(config).
 
     Args:
         model_id: OpenRouter model identifier (e.g., "openai/gpt-5.1")
 
     Returns:
-        Reasoning config dict or None if provider doesn't support reasoning
+        Read-only reasoning config mapping or None if provider doesn't support reasoning
     """
-    # Sort by length (descending) to match most specific prefix first
-    sorted_prefixes = sorted(PROVIDER_REASONING_DEFAULTS.keys(), key=len, reverse=True)
-
-    for prefix in sorted_prefixes:
-        if model_id.startswith(prefix):
-            return PROVIDER_REASONING_DEFAULTS[prefix].copy()
+    match = REASONING_PREFIX_RE.match(model_id)
+    if match is None:
+        return None
 
-    return None
+    return PROVIDER_REASONING_DEFAULTS[match.group(1)]
 
 
+@lru_cache(maxsize=256)
 def supports_reasoning(model_id: str) -> bool:
     """Check if a model supports reasoning based on its provider."""
-    return get_reasoning_config(model_id) is not None
+    return REASONING_PREFIX_RE.match(model_id) is not None
 
 
-def get_available_effort_levels(model_id: str) -> List[str]:
+@lru_cache(maxsize=256)
+def get_available_effort_levels(model_id: str) -> Tuple[str, ...]:
     """
     Get available reasoning effort levels for a model.
 
     Returns:
-        List of effort level strings, or empty list if not supported
+        Tuple of effort level strings, or empty tuple if not supported
     """
     config = get_reasoning_config(model_id)
     if config is None:
-        return []
+        return _NO_EFFORT_LEVELS
 
     # Check if this provider uses effort-based reasoning
     if "effort" in config:
         # Find matching provider prefix for effort levels
-        sorted_prefixes = sorted(PROVIDER_EFFORT_LEVELS.keys(), key=len, reverse=True)
-        for prefix in sorted_prefixes:
-            if model_id.startswith(prefix):
-                return PROVIDER_EFFORT_LEVELS[prefix].copy()
+        match = EFFORT_PREFIX_RE.match(model_id)
+        if match is not None:
+            return PROVIDER_EFFORT_LEVELS[match.group(1)]
         # Default for unspecified effort-based providers
-        return ["low", "high"]
+        return DEFAULT_EFFORT_LEVELS
     elif "max_tokens" in config:
         # Token-based providers don't have effort levels
-        return []
+        return _NO_EFFORT_LEVELS
     elif "exclude" in config:
         # DeepSeek uses boolean toggle, no effort levels
-        return []
+        return _NO_EFFORT_LEVELS
 
-    return []
+    return _NO_EFFORT_LEVELS
 
 
+@lru_cache(maxsize=256)
 def get_reasoning_param_type(model_id: str) -> Optional[str]:
     """
     Determine what type of reasoning parameter this model uses.
@@ -87,37 +106,105 @@ def get_reasoning_param_type(model_id: str) -> Optional[str]:
     return None
 
 
-def get_max_tokens_range(model_id: str) -> Optional[Dict[str, int]]:
+@lru_cache(maxsize=256)
+def get_max_tokens_range(model_id: str) -> Optional[Mapping[str, int]]:
     """
     Get min/max token range for token-based reasoning providers.
 
     Returns:
-        {"min": int, "max": int, "default": int} or None if not applicable
+        Read-only {"min": int, "max": int, "default": int} or None if not applicable
     """
-    config = get_reasoning_config(model_id)
-    if config is None or "max_tokens" not in config:
+    match = REASONING_PREFIX_RE.match(model_id)
+    if match is None:
         return None
 
-    # Anthropic Claude: 1024-64000 range
-    if model_id.startswith("anthropic"):
-        return {"min": 1024, "max": 64000, "default": config.get("max_tokens", 4096)}
-
-    # Google thinking models: similar range
-    if model_id.startswith("google"):
-        return {"min": 1024, "max": 32000, "default": config.get("max_tokens", 4096)}
-
-    # Generic fallback
-    return {"min": 1024, "max": 16000, "default": config.get("max_tokens", 4096)}
+    # Only token-based providers have an entry
+    return PROVIDER_TOKEN_RANGE.get(match.group(1))
 
 
 # Module-level cache for model list (avoid repeated API calls)
-_model_cache: Optional[Set[str]] = None
+# Backed by MODEL_CACHE_PATH so multiple worker processes share one fetch.
+_model_cache: Optional[FrozenSet[str]] = None
 _cache_timestamp: Optional[float] = None
+_refresh_task: Optional["asyncio.Task[Optional[FrozenSet[str]]]"] = None
 CACHE_TTL_SECONDS = 300  # 5 minutes
 
 
-async def _get_available_models() -> Set[str]:
-    """Fetch and cache the list of available models from OpenRouter."""
+def _read_models_file() -> Optional[Tuple[float, FrozenSet[str]]]:
+    """Load (timestamp, model ids) from the on-disk cache, or None if unusable."""
+    try:
+        with open(MODEL_CACHE_PATH, "rb") as f:
+            data = orjson.loads(f.read())
+        return float(data["ts"]), frozenset(sys.intern(m) for m in data["models"])
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+
+
+def _write_models_file(timestamp: float, models: FrozenSet[str]):
+    """Atomically write the model list to the on-disk cache."""
+    Path(MODEL_CACHE_PATH).parent.mkdir(parents=True, exist_ok=True)
+
+    # Serialize writers across processes; readers never see a partial file
+    # because the new contents are swapped in with os.replace()
+    with open(f"{MODEL_CACHE_PATH}.lock", "w") as lock_file:
+        fcntl.flock(lock_file, fcntl.LOCK_EX)
+        try:
+            tmp_path = f"{MODEL_CACHE_PATH}.{os.getpid()}.tmp"
+            with open(tmp_path, "wb") as f:
+                f.write(orjson.dumps({"ts": timestamp, "models": sorted(models)}))
+            os.replace(tmp_path, MODEL_CACHE_PATH)
+        finally:
+            fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+
+async def _refresh_models_file() -> Optional[FrozenSet[str]]:
+    """Fetch the model list from OpenRouter and update both caches."""
+    global _model_cache, _cache_timestamp
+
+    # Imported here to avoid a circular import (openrouter imports this module)
+    from .openrouter import get_client
+
+    try:
+        client = get_client()
+        response = await client.get("https://openrouter.ai/api/v1/models", timeout=10.0)
+        response.raise_for_status()
+        data = orjson.loads(response.content)
+        # Interned ids let membership checks against interned config strings
+        # short-circuit on identity
+        available = frozenset(sys.intern(m["id"]) for m in data.get("data", []))
+    except Exception as e:
+        print(f"Error fetching model list: {e}")
+        return None
+
+    now = time.time()
+    _model_cache = available
+    _cache_timestamp = now
+
+    try:
+        _write_models_file(now, _model_cache)
+    except OSError as e:
+        print(f"Error writing model cache: {e}")
+
+    return _model_cache
+
+
+def _schedule_refresh() -> "asyncio.Task[Optional[FrozenSet[str]]]":
+    """Start a background refresh unless one is already in flight."""
+    global _refresh_task
+
+    if _refresh_task is None or _refresh_task.done():
+        _refresh_task = asyncio.create_task(_refresh_models_file())
+    return _refresh_task
+
+
+async def _get_available_models() -> FrozenSet[str]:
+    """
+    Get the set of available models from OpenRouter.
+
+    Uses stale-while-revalidate: a fresh cache is returned directly, a stale
+    one is returned immediately while a background refresh runs, and only a
+    cold start waits on the network.
+    """
     global _model_cache, _cache_timestamp
 
     now = time.time()
@@ -127,22 +214,70 @@ async def _get_available_models() -> Set[str]:
         if now - _cache_timestamp < CACHE_TTL_SECONDS:
             return _model_cache
 
-    try:
-        async with httpx.AsyncClient(timeout=10.0) as client:
-            response = await client.get("https://openrouter.ai/api/v1/models")
-            response.raise_for_status()
-            data = response.json()
-            _model_cache = {m["id"] for m in data.get("data", [])}
-            _cache_timestamp = now
-            return _model_cache
-    except Exception:
-        # On error, return cached if available, else empty set
-        if _model_cache is not None:
+    # Another worker may have refreshed the on-disk cache more recently
+    cached = _read_models_file()
+    if cached is not None and (
+        _cache_timestamp is None or cached[0] > _cache_timestamp
+    ):
+        _cache_timestamp, _model_cache = cached
+        if now - _cache_timestamp < CACHE_TTL_SECONDS:
             return _model_cache
-        return set()
 
+    if _model_cache is not None:
+        # Serve stale data now, revalidate in the background
+        _schedule_refresh()
+        return _model_cache
+
+    # Cold start: wait for the fetch (shared by concurrent callers).
+    # On error, return an empty set
+    models = await asyncio.shield(_schedule_refresh())
+    return models if models is not None else frozenset()
+
+
+@dataclass(slots=True)
+class ValidationResult:
+    """Outcome of validating a model ID, plus its reasoning capabilities."""
+
+    model_id: str
+    valid: bool = False
+    supports_reasoning: bool = False
+    reasoning_param_type: Optional[str] = None
+    effort_levels: Tuple[str, ...] = ()
+    max_tokens_range: Optional[Mapping[str, int]] = None
+    default_config: Optional[Mapping[str, Any]] = None
+    error: Optional[str] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert result to a JSON-serializable dictionary for the API."""
+        return {
+            "valid": self.valid,
+            "model_id": self.model_id,
+            "supports_reasoning": self.supports_reasoning,
+            "reasoning_param_type": self.reasoning_param_type,
+            "effort_levels": list(self.effort_levels),
+            # Capability mappings are shared read-only proxies; copy to dicts
+            "max_tokens_range": (
+                dict(self.max_tokens_range)
+                if self.max_tokens_range is not None
+                else None
+            ),
+            "default_config": (
+                dict(self.default_config) if self.default_config is not None else None
+            ),
+            "error": self.error,
+        }
+
+
+# Models from config.py defaults, treated as valid without a lookup
+KNOWN_GOOD_MODELS: FrozenSet[str] = frozenset(COUNCIL_MODELS + [CHAIRMAN_MODEL])
 
-async def validate_model(model_id: str) -> Dict[str, Any]:
+# Recent validation outcomes: model_id -> (expires_at, error or None if valid)
+_validation_cache: Dict[str, Tuple[float, Optional[str]]] = {}
+VALIDATION_CACHE_TTL_SECONDS = 600  # 10 minutes
+VALIDATION_CACHE_MAXSIZE = 256
+
+
+async def validate_model(model_id: str) -> ValidationResult:
     """
     Validate that a model exists via OpenRouter /models endpoint (no generation cost).
 
@@ -150,47 +285,92 @@ async def validate_model(model_id: str) -> Dict[str, Any]:
         model_id: OpenRouter model identifier
 
     Returns:
-        Dict with validation result and capabilities:
-        {
-            "valid": bool,
-            "model_id": str,
-            "supports_reasoning": bool,
-            "reasoning_param_type": str | None,
-            "effort_levels": list[str],
-            "max_tokens_range": dict | None,
-            "default_config": dict | None,
-            "error": str | None
-        }
+        ValidationResult with validity, error message and reasoning capabilities
     """
-    result = {
-        "valid": False,
-        "model_id": model_id,
-        "supports_reasoning": supports_reasoning(model_id),
-        "reasoning_param_type": get_reasoning_param_type(model_id),
-        "effort_levels": get_available_effort_levels(model_id),
-        "max_tokens_range": get_max_tokens_range(model_id),
-        "default_config": get_reasoning_config(model_id),
-        "error": None,
-    }
+    result = ValidationResult(
+        model_id=model_id,
+        supports_reasoning=supports_reasoning(model_id),
+        reasoning_param_type=get_reasoning_param_type(model_id),
+        effort_levels=get_available_effort_levels(model_id),
+        max_tokens_range=get_max_tokens_range(model_id),
+        default_config=get_reasoning_config(model_id),
+    )
 
     if not model_id or not model_id.strip():
-        result["error"] = "Model ID cannot be empty"
+        result.error = "Model ID cannot be empty"
         return result
 
     # Validate format (should be provider/model)
     if "/" not in model_id:
-        result["error"] = "Model ID should be in format 'provider/model'"
+        result.error = "Model ID should be in format 'provider/model'"
+        return result
+
+    # Configured defaults are known to exist; skip the lookup entirely
+    if model_id in KNOWN_GOOD_MODELS:
+        result.valid = True
+        return result
+
+    # Reuse a recent outcome for this model if we have one
+    cached = _validation_cache.get(model_id)
+    if cached is not None and time.time() < cached[0]:
+        result.valid = cached[1] is None
+        result.error = cached[1]
         return result
 
     # Check against cached model list
     available_models = await _get_available_models()
     if not available_models:
-        result["error"] = "Could not fetch model list from OpenRouter"
+        # Transient failure, don't cache it
+        result.error = "Could not fetch model list from OpenRouter"
         return result
 
+    now = time.time()
     if model_id in available_models:
-        result["valid"] = True
+        result.valid = True
+        expires_at = now + VALIDATION_CACHE_TTL_SECONDS
     else:
-        result["error"] = f"Model '{model_id}' not found on OpenRouter"
+        result.error = f"Model '{model_id}' not found on OpenRouter"
+        # A "not found" is only as current as the model list it came from:
+        # expire it with the list so newly added models aren't rejected, and
+        # don't cache it at all if the list was already stale
+        expires_at = (_cache_timestamp or 0.0) + CACHE_TTL_SECONDS
+        if expires_at <= now:
+            return result
+
+    _validation_cache.pop(model_id, None)
+    if len(_validation_cache) >= VALIDATION_CACHE_MAXSIZE:
+        # Evict the oldest entry (dicts preserve insertion order)
+        _validation_cache.pop(next(iter(_validation_cache)))
+    _validation_cache[model_id] = (expires_at, result.error)
 
     return result
+
+
+async def validate_models(model_ids: Iterable[str]) -> Dict[str, ValidationResult]:
+    """
+    Validate several models concurrently.
+
+    The model list is fetched (or read from cache) once up front, so the
+    individual validations all hit the cache and the batch takes about as
+    long as a single validation.
+
+    Args:
+        model_ids: OpenRouter model identifiers
+
+    Returns:
+        Dict mapping each model identifier to its ValidationResult
+    """
+    model_ids = list(model_ids)
+    await _get_available_models()
+    results = await asyncio.gather(*(validate_model(mid) for mid in model_ids))
+    return dict(zip(model_ids, results))
+
+
+async def warmup():
+    """
+    Prime the model list, capability and validation caches for the defaults.
+
+    Run in the background at startup so the first council request doesn't
+    pay for the model list fetch.
+    """
+    await validate_models(dict.fromkeys(COUNCIL_MODELS + [CHAIRMAN_MODEL]))
@@ -1,14 +1,126 @@
 """OpenRouter API client for making LLM requests."""
 
+import asyncio
 import httpx
-from typing import List, Dict, Any, Optional
-from .config import OPENROUTER_API_KEY, OPENROUTER_API_URL, PROVIDER_REASONING_DEFAULTS
+import orjson
+import random
+from typing import List, Dict, Any, Optional, AsyncIterator, Tuple
+from .config import OPENROUTER_API_KEY, OPENROUTER_API_URL
+from .models import get_reasoning_config
+
+# Request headers are constant for the life of the process
+# (payloads are encoded with orjson, so Content-Type is set explicitly)
+_AUTH_HEADERS = {
+    "Authorization": f"Bearer {OPENROUTER_API_KEY}",
+    "Content-Type": "application/json",
+}
+
+# Default request timeout: non-streaming calls get no bytes until the model
+# has finished generating, so any model may need the full budget. Only
+# connecting to OpenRouter (or waiting for a pooled connection) is held to
+# the short budget, so an unreachable API fails fast.
+REQUEST_TIMEOUT_SECONDS = 120.0
+CONNECT_TIMEOUT_SECONDS = 10.0
+_DEFAULT_TIMEOUT = httpx.Timeout(
+    REQUEST_TIMEOUT_SECONDS,
+    connect=CONNECT_TIMEOUT_SECONDS,
+    pool=CONNECT_TIMEOUT_SECONDS,
+)
+
+# Transient statuses worth retrying (rate limiting and upstream errors)
+_RETRY_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+_MAX_ATTEMPTS = 3
+_MAX_RETRY_AFTER_SECONDS = 10.0
+
+# Shared client so connections (TCP + TLS) are kept alive and reused across
+# requests instead of being re-established for every council member.
+# HTTP/2 lets the parallel council queries multiplex over a single connection;
+# httpx negotiates gzip/deflate/br response compression automatically.
+_client: Optional[httpx.AsyncClient] = None
+# Pooled connections belong to the event loop that opened them
+_client_loop: Optional[asyncio.AbstractEventLoop] = None
+
+
+def get_client() -> httpx.AsyncClient:
+    """
+    Get the process-wide HTTP client, creating it on first use.
+
+    A new client is created if the running event loop has changed (e.g. a
+    script calling asyncio.run twice), since the old one can't be reused.
+    """
+    global _client, _client_loop
+
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        loop = None
+
+    if _client is None or _client.is_closed or _client_loop is not loop:
+        _client_loop = loop
+        _client = httpx.AsyncClient(
+            http2=True,
+            timeout=httpx.Timeout(120.0),
+            limits=httpx.Limits(max_keepalive_connections=16, max_connections=32),
+        )
+    return _client
+
+
+async def close_client():
+    """Close the shared HTTP client (called on application shutdown)."""
+    global _client
+
+    if _client is not None:
+        await _client.aclose()
+        _client = None
+
+
+def _build_payload(
+    model: str,
+    messages: List[Dict[str, str]],
+    include_reasoning: bool,
+    reasoning_override: Optional[Dict[str, Any]],
+) -> Dict[str, Any]:
+    """Build the chat completion request body for a model."""
+    payload = {
+        "model": model,
+        "messages": messages,
+    }
+
+    # Add reasoning parameters if requested and supported
+    if include_reasoning:
+        if reasoning_override is not None:
+            # Use explicit override
+            payload["reasoning"] = reasoning_override
+        else:
+            # Use the (cached) provider default for this model, if any
+            reasoning_config = get_reasoning_config(model)
+            if reasoning_config is not None:
+                payload["reasoning"] = dict(reasoning_config)
+
+    return payload
+
+
+def _retry_delay(response: httpx.Response, attempt: int) -> float:
+    """
+    Seconds to wait before retrying a failed request.
+
+    Honors a numeric Retry-After header (capped), otherwise uses jittered
+    exponential backoff.
+    """
+    retry_after = response.headers.get("Retry-After")
+    if retry_after is not None:
+        try:
+            return min(max(float(retry_after), 0.0), _MAX_RETRY_AFTER_SECONDS)
+        except ValueError:
+            pass  # HTTP-date form; fall back to backoff
+
+    return min(2**attempt, 4) + random.random() * 0.25
 
 
 async def query_model(
     model: str,
     messages: List[Dict[str, str]],
-    timeout: float = 120.0,
+    timeout: Optional[float] = None,
     include_reasoning: bool = False,
     reasoning_override: Optional[Dict[str, Any]] = None,
 ) -> Optional[Dict[str, Any]]:
@@ -18,84 +130,231 @@ async def query_model(
     Args:
         model: OpenRouter model identifier (e.g., "openai/gpt-4o")
         messages: List of message dicts with 'role' and 'content'
-        timeout: Request timeout in seconds
+        timeout: Request timeout in seconds (default 120s, 10s to connect)
         include_reasoning: Whether to include reasoning parameters
         reasoning_override: Optional dict to override default reasoning config
 
+    Transient failures (429 and 5xx gateway errors) are retried with backoff.
+
     Returns:
         Response dict with 'content' and optional 'reasoning_details', or None if failed
     """
-    headers = {
-        "Authorization": f"Bearer {OPENROUTER_API_KEY}",
-        "Content-Type": "application/json",
-    }
-
-    payload = {
-        "model": model,
-        "messages": messages,
-    }
-
-    # Add reasoning parameters if requested and supported
-    if include_reasoning:
-        if reasoning_override is not None:
-            # Use explicit override
-            payload["reasoning"] = reasoning_override
-        else:
-            # Find partial matches for model prefix in defaults
-            # We process keys sorted by length (descending) to match the most specific prefix first
-            # e.g. 'google/gemini-2.0-flash-thinking' matches before 'google'
-            sorted_prefixes = sorted(
-                PROVIDER_REASONING_DEFAULTS.keys(), key=len, reverse=True
-            )
-
-            for prefix in sorted_prefixes:
-                if model.startswith(prefix):
-                    payload["reasoning"] = PROVIDER_REASONING_DEFAULTS[prefix]
-                    break
+    payload = _build_payload(model, messages, include_reasoning, reasoning_override)
+    if timeout is None:
+        timeout = _DEFAULT_TIMEOUT
 
     try:
-        async with httpx.AsyncClient(timeout=timeout) as client:
+        client = get_client()
+        content = orjson.dumps(payload)
+
+        for attempt in range(_MAX_ATTEMPTS):
             response = await client.post(
-                OPENROUTER_API_URL, headers=headers, json=payload
+                OPENROUTER_API_URL,
+                headers=_AUTH_HEADERS,
+                content=content,
+                timeout=timeout,
             )
-            response.raise_for_status()
+            if (
+                response.status_code in _RETRY_STATUS_CODES
+                and attempt < _MAX_ATTEMPTS - 1
+            ):
+                await asyncio.sleep(_retry_delay(response, attempt))
+                continue
+            break
 
-            data = response.json()
-            message = data["choices"][0]["message"]
+        response.raise_for_status()
 
-            return {
-                "content": message.get("content"),
-                "reasoning_details": message.get("reasoning_details"),
-            }
+        data = orjson.loads(response.content)
+        message = data["choices"][0]["message"]
+
+        return {
+            "content": message.get("content"),
+            "reasoning_details": message.get("reasoning_details"),
+        }
 
     except Exception as e:
         print(f"Error querying model {model}: {e}")
         return None
 
 
+async def query_model_stream(
+    model: str,
+    messages: List[Dict[str, str]],
+    timeout: Optional[float] = None,
+    include_reasoning: bool = False,
+    reasoning_override: Optional[Dict[str, Any]] = None,
+) -> AsyncIterator[Dict[str, Any]]:
+    """
+    Query a single model via OpenRouter API, streaming the response.
+
+    Uses OpenRouter's SSE streaming so tokens can be forwarded as they are
+    generated instead of buffering the whole (possibly very long) response.
+    Transient failures before the stream starts are retried like query_model.
+
+    Args:
+        model: OpenRouter model identifier (e.g., "openai/gpt-4o")
+        messages: List of message dicts with 'role' and 'content'
+        timeout: Request timeout in seconds (default 120s, 10s to connect)
+        include_reasoning: Whether to include reasoning parameters
+        reasoning_override: Optional dict to override default reasoning config
+
+    Yields:
+        Delta dicts with 'content' and optional 'reasoning_details'
+
+    Raises:
+        Exception: If the request fails or OpenRouter reports an error mid-stream
+            (query_models_parallel_stream turns this into a failed result)
+    """
+    payload = _build_payload(model, messages, include_reasoning, reasoning_override)
+    payload["stream"] = True
+    if timeout is None:
+        timeout = _DEFAULT_TIMEOUT
+
+    client = get_client()
+    request = client.build_request(
+        "POST",
+        OPENROUTER_API_URL,
+        headers=_AUTH_HEADERS,
+        content=orjson.dumps(payload),
+        timeout=timeout,
+    )
+
+    for attempt in range(_MAX_ATTEMPTS):
+        response = await client.send(request, stream=True)
+        if response.status_code in _RETRY_STATUS_CODES and attempt < _MAX_ATTEMPTS - 1:
+            await response.aclose()
+            await asyncio.sleep(_retry_delay(response, attempt))
+            continue
+        break
+
+    try:
+        response.raise_for_status()
+
+        async for line in response.aiter_lines():
+            # Skip blank separators and SSE comments (keep-alive pings)
+            if not line.startswith("data:"):
+                continue
+
+            data = line[len("data:") :].strip()
+            if data == "[DONE]":
+                break
+
+            try:
+                chunk = orjson.loads(data)
+            except orjson.JSONDecodeError:
+                # One bad line shouldn't throw away the rest of the response
+                print(f"Skipping malformed stream chunk from {model}: {data[:200]}")
+                continue
+
+            if "error" in chunk:
+                raise RuntimeError(f"OpenRouter stream error: {chunk['error']}")
+            if not chunk.get("choices"):
+                continue
+
+            delta = chunk["choices"][0].get("delta", {})
+            if delta.get("content") or delta.get("reasoning_details"):
+                yield {
+                    "content": delta.get("content"),
+                    "reasoning_details": delta.get("reasoning_details"),
+                }
+    finally:
+        await response.aclose()
+
+
+async def query_models_parallel_stream(
+    models: List[str], messages: List[Dict[str, str]], include_reasoning: bool = False
+) -> AsyncIterator[Tuple[str, Dict[str, Any]]]:
+    """
+    Stream multiple models in parallel, interleaving their events.
+
+    Args:
+        models: List of OpenRouter model identifiers
+        messages: List of message dicts to send to each model
+        include_reasoning: Whether to include reasoning parameters
+
+    Yields:
+        (model identifier, event) pairs as they happen, where event is either
+        {"type": "delta", "content": str} for each streamed content chunk, or
+        {"type": "complete", "response": dict | None} once per distinct model
+        (None if the model failed, matching query_models_parallel)
+    """
+    queue: "asyncio.Queue[Tuple[str, Dict[str, Any]]]" = asyncio.Queue()
+
+    async def _pump(model: str):
+        content_parts = []
+        reasoning_details = []
+        try:
+            async for delta in query_model_stream(
+                model, messages, include_reasoning=include_reasoning
+            ):
+                if delta["content"]:
+                    content_parts.append(delta["content"])
+                    await queue.put(
+                        (model, {"type": "delta", "content": delta["content"]})
+                    )
+                details = delta["reasoning_details"]
+                if isinstance(details, list):
+                    reasoning_details.extend(details)
+                elif details:
+                    reasoning_details.append(details)
+            response = {
+                "content": "".join(content_parts),
+                "reasoning_details": reasoning_details or None,
+            }
+        except Exception as e:
+            print(f"Error streaming model {model}: {e}")
+            response = None
+
+        await queue.put((model, {"type": "complete", "response": response}))
+
+    # Each model is streamed once, even if listed twice
+    tasks = [asyncio.create_task(_pump(model)) for model in dict.fromkeys(models)]
+
+    try:
+        remaining = len(tasks)
+        while remaining:
+            model, event = await queue.get()
+            if event["type"] == "complete":
+                remaining -= 1
+            yield model, event
+    finally:
+        # Don't leave requests running if the caller stops iterating early
+        for task in tasks:
+            task.cancel()
+
+
 async def query_models_parallel(
     models: List[str], messages: List[Dict[str, str]], include_reasoning: bool = False
-) -> Dict[str, Optional[Dict[str, Any]]]:
+) -> AsyncIterator[Tuple[str, Optional[Dict[str, Any]]]]:
     """
-    Query multiple models in parallel.
+    Query multiple models in parallel, yielding each result as soon as it arrives.
+
+    Callers can start processing fast models while slower ones are still
+    generating instead of waiting on the slowest council member.
 
     Args:
         models: List of OpenRouter model identifiers
         messages: List of message dicts to send to each model
+        include_reasoning: Whether to include reasoning parameters
 
-    Returns:
-        Dict mapping model identifier to response dict (or None if failed)
+    Yields:
+        (model identifier, response dict or None if failed) in completion order,
+        once per distinct model
     """
-    import asyncio
 
-    # Create tasks for all models
-    tasks = [
-        query_model(model, messages, include_reasoning=include_reasoning)
-        for model in models
-    ]
+    async def _query(model: str) -> Tuple[str, Optional[Dict[str, Any]]]:
+        response = await query_model(
+            model, messages, include_reasoning=include_reasoning
+        )
+        return model, response
 
-    # Wait for all to complete
-    responses = await asyncio.gather(*tasks)
+    # Create tasks for all models (each model queried once, even if listed twice)
+    tasks = [asyncio.create_task(_query(model)) for model in dict.fromkeys(models)]
 
-    # Map models to their responses
-    return {model: response for model, response in zip(models, responses)}
+    try:
+        for next_done in asyncio.as_completed(tasks):
+            yield await next_done
+    finally:
+        # Don't leave requests running if the caller stops iterating early
+        for task in tasks:
+            task.cancel()
@@ -129,6 +129,56 @@ function App() {
             });
             break;
 
+          case 'stage1_delta':
+            // Append streamed tokens to that model's in-progress response
+            setCurrentConversation((prev) => {
+              const messages = [...prev.messages];
+              const lastMsg = messages[messages.length - 1];
+              const stage1 = [...(lastMsg.stage1 || [])];
+              const index = stage1.findIndex((r) => r.model === event.data.model);
+              if (index === -1) {
+                stage1.push({ model: event.data.model, response: event.data.content });
+              } else {
+                stage1[index] = {
+                  ...stage1[index],
+                  response: stage1[index].response + event.data.content,
+                };
+              }
+              messages[messages.length - 1] = { ...lastMsg, stage1 };
+              return { ...prev, messages };
+            });
+            break;
+
+          case 'stage1_model_complete':
+            // Replace the streamed text with the model's final response
+            setCurrentConversation((prev) => {
+              const messages = [...prev.messages];
+              const lastMsg = messages[messages.length - 1];
+              const stage1 = (lastMsg.stage1 || []).filter(
+                (r) => r.model !== event.data.model
+              );
+              const index = (lastMsg.stage1 || []).findIndex(
+                (r) => r.model === event.data.model
+              );
+              stage1.splice(index === -1 ? stage1.length : index, 0, event.data);
+              messages[messages.length - 1] = { ...lastMsg, stage1 };
+              return { ...prev, messages };
+            });
+            break;
+
+          case 'stage1_model_failed':
+            // Drop any partial text from a model that failed mid-stream
+            setCurrentConversation((prev) => {
+              const messages = [...prev.messages];
+              const lastMsg = messages[messages.length - 1];
+              const stage1 = (lastMsg.stage1 || []).filter(
+                (r) => r.model !== event.data.model
+              );
+              messages[messages.length - 1] = { ...lastMsg, stage1 };
+              return { ...prev, messages };
+            });
+            break;
+
           case 'stage1_complete':
             setCurrentConversation((prev) => {
               const messages = [...prev.messages];
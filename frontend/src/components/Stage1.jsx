@@ -9,6 +9,9 @@ export default function Stage1({ responses }) {
     return null;
   }
 
+  // Responses can arrive (and be reordered) while streaming
+  const activeIndex = Math.min(activeTab, responses.length - 1);
+
   return (
     <div className="stage stage1">
       <h3 className="stage-title">Stage 1: Individual Responses</h3>
@@ -17,7 +20,7 @@ export default function Stage1({ responses }) {
         {responses.map((resp, index) => (
           <button
             key={index}
-            className={`tab ${activeTab === index ? 'active' : ''}`}
+            className={`tab ${activeIndex === index ? 'active' : ''}`}
             onClick={() => setActiveTab(index)}
           >
             {resp.model.split('/')[1] || resp.model}
@@ -26,9 +29,9 @@ export default function Stage1({ responses }) {
       </div>
 
       <div className="tab-content">
-        <div className="model-name">{responses[activeTab].model}</div>
+        <div className="model-name">{responses[activeIndex].model}</div>
         <div className="response-text">
-          <MarkdownRenderer content={responses[activeTab].response} />
+          <MarkdownRenderer content={responses[activeIndex].response} />
         </div>
       </div>
     </div>